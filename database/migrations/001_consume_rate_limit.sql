@@ -0,0 +1,72 @@
+-- ============================================================================
+-- MIGRATION 001: Atomic rate-limit check (consume_rate_limit)
+-- ============================================================================
+-- FOR EXISTING DATABASES set up from an earlier database/schema.sql.
+-- (A fresh install gets this function from schema.sql; do NOT re-run
+-- schema.sql on a live database - it drops every table first.)
+--
+-- INSTRUCTIONS:
+-- Paste into Supabase SQL Editor and run BEFORE deploying the backend
+-- version that calls consume_rate_limit. Safe to run multiple times.
+-- ============================================================================
+
+-- Atomic check-and-increment: ONE call per request from the backend.
+-- The row lock (FOR UPDATE) queues concurrent requests for the same user,
+-- so a burst is cut off after exactly the per-minute limit.
+-- Resets: per-minute after 60 seconds, per-day at the UTC day boundary.
+CREATE OR REPLACE FUNCTION public.consume_rate_limit(
+    p_user_id UUID,
+    p_per_minute INTEGER,
+    p_per_day INTEGER
+)
+RETURNS TABLE (allowed BOOLEAN, limit_type TEXT, retry_after_seconds INTEGER) AS $$
+DECLARE
+    rl public.rate_limits%ROWTYPE;
+    now_ts TIMESTAMPTZ := NOW();
+    today DATE := (NOW() AT TIME ZONE 'UTC')::DATE;
+BEGIN
+    INSERT INTO public.rate_limits (user_id, last_minute_reset, last_day_reset)
+    VALUES (p_user_id, now_ts, today)
+    ON CONFLICT (user_id) DO NOTHING;
+    
+    SELECT * INTO rl FROM public.rate_limits
+    WHERE user_id = p_user_id
+    FOR UPDATE;
+    
+    IF now_ts - rl.last_minute_reset > INTERVAL '1 minute' THEN
+        rl.requests_this_minute := 0;
+        rl.last_minute_reset := now_ts;
+    END IF;
+    
+    IF today > rl.last_day_reset THEN
+        rl.requests_today := 0;
+        rl.last_day_reset := today;
+    END IF;
+    
+    -- Hard limits (no grace period); rejected requests are not counted
+    IF rl.requests_this_minute >= p_per_minute THEN
+        RETURN QUERY SELECT FALSE, 'minute'::TEXT, GREATEST(
+            1, 60 - FLOOR(EXTRACT(EPOCH FROM now_ts - rl.last_minute_reset))::INTEGER
+        );
+        RETURN;
+    END IF;
+    
+    IF rl.requests_today >= p_per_day THEN
+        RETURN QUERY SELECT FALSE, 'day'::TEXT, NULL::INTEGER;
+        RETURN;
+    END IF;
+    
+    UPDATE public.rate_limits SET
+        requests_this_minute = rl.requests_this_minute + 1,
+        requests_today = rl.requests_today + 1,
+        last_minute_reset = rl.last_minute_reset,
+        last_day_reset = rl.last_day_reset
+    WHERE user_id = p_user_id;
+    
+    RETURN QUERY SELECT TRUE, NULL::TEXT, NULL::INTEGER;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Backend only: users must not be able to spend each other's quota
+REVOKE EXECUTE ON FUNCTION public.consume_rate_limit(UUID, INTEGER, INTEGER)
+    FROM PUBLIC, anon, authenticated;
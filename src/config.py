@@ -49,6 +49,12 @@ class Settings(BaseSettings):
 
     # Embeddings
     embeddings_provider: str = "openai"  # or "placeholder"
+    # In-process cache of original-text embeddings (0 = disabled)
+    embeddings_cache_size: int = 0
+    # Optional SQLite file persisting original-text embeddings ("" = disabled)
+    embeddings_cache_path: str = ""
+    # In-process memo of entity/tone analyses, per analyzer (0 = disabled)
+    analysis_cache_size: int = 0
     
     # Server
     host: str = "0.0.0.0"
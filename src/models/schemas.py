@@ -3,7 +3,7 @@ Pydantic models for request/response validation.
 Used across all phases.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Literal
 from datetime import datetime
 from uuid import UUID
@@ -55,9 +55,8 @@ class RewriteRequest(BaseModel):
         description="What the user wants to do: rewrite, humanize, or clarify"
     )
     
-    class Config:
-        # Reject any extra fields
-        extra = "forbid"
+    # Reject any extra fields; strict: no type coercion (JSON strings only)
+    model_config = ConfigDict(strict=True, extra="forbid")
 
 
 
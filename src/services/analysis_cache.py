@@ -0,0 +1,67 @@
+"""
+Analysis Memo
+
+Opt-in, process-wide memo for the pure text analyses (entity extraction,
+tone analysis). The same original is re-analyzed on every retry/variant,
+so repeat requests can skip the regex passes.
+
+PRIVACY (same policy as the embeddings cache):
+- Disabled by default (ANALYSIS_CACHE_SIZE = 0)
+- Keys are blake2b digests of analyzer + text, never the raw text
+- Bounded LRU of ANALYSIS_CACHE_SIZE entries per analyzer
+- Cached results must be immutable (callers share them)
+"""
+
+from collections import OrderedDict
+from typing import Callable, Generic, TypeVar
+import hashlib
+import threading
+
+from ..config import get_settings
+
+T = TypeVar("T")
+
+
+class AnalysisMemo(Generic[T]):
+    """Digest-keyed LRU of one analyzer's results (thread-safe)."""
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace.encode("utf-8") + b"\0"
+        self._entries: "OrderedDict[bytes, T]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, owner: type, text: str, compute: Callable[[], T]) -> T:
+        """
+        Return the memoized result for (owner, text), computing it on a miss.
+
+        owner is the analyzer class, so subclasses with different patterns
+        never share entries. Always computes when ANALYSIS_CACHE_SIZE is 0.
+        """
+        max_size = get_settings().analysis_cache_size
+        if max_size <= 0:
+            return compute()
+
+        key = hashlib.blake2b(
+            self.namespace + owner.__qualname__.encode("utf-8") + b"\0"
+            + text.encode("utf-8"),
+            digest_size=16
+        ).digest()
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                return cached
+
+        result = compute()
+
+        with self._lock:
+            self._entries[key] = result
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
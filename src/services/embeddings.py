@@ -6,8 +6,12 @@ Vector embeddings for semantic similarity computation.
 CORE PRINCIPLE:
 Embeddings are ephemeral measurements, not data assets.
 - Use the SAME embedding model for both texts
-- Do NOT fine-tune, cache, persist, or train
-- Embeddings are computed fresh each time
+- Do NOT fine-tune or train on embeddings
+- By default embeddings are computed fresh each time and never stored
+- Opt-in (EMBEDDINGS_CACHE_SIZE): the original text's embedding may be
+  kept in process memory, keyed by a hash of model + text (never raw text)
+- Opt-in (EMBEDDINGS_CACHE_PATH): the same entries may be persisted to a
+  local SQLite file (hash + float16 vector only, never raw text)
 
 This module provides:
 - Abstract EmbeddingsProvider interface
@@ -17,11 +21,91 @@ This module provides:
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from array import array
+from collections import OrderedDict
+from typing import List, Optional
+import asyncio
+import hashlib
+import logging
 import math
+import operator
+import sqlite3
+import struct
+import threading
 
 from ..config import get_settings
 
+# Optional SIMD kernels for the cosine computation (pure Python fallback)
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
+
+
+logger = logging.getLogger(__name__)
+
+
+# Opt-in LRU of original-text embeddings, shared across provider instances
+# (providers are created per request). Keys are digests, not text.
+_embedding_cache: "OrderedDict[bytes, List[float]]" = OrderedDict()
+
+# Opt-in persistent layer behind the LRU, one connection per database path
+_disk_cache_lock = threading.Lock()
+_disk_cache_conns: "dict[str, sqlite3.Connection]" = {}
+
+
+def _get_disk_cache(path: str) -> sqlite3.Connection:
+    """Open (once) the SQLite embedding cache at path."""
+    with _disk_cache_lock:
+        conn = _disk_cache_conns.get(path)
+        if conn is None:
+            conn = sqlite3.connect(path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embedding_cache ("
+                "hash BLOB PRIMARY KEY, model TEXT NOT NULL, vector BLOB NOT NULL)"
+            )
+            conn.commit()
+            _disk_cache_conns[path] = conn
+        return conn
+
+
+def _disk_cache_get(path: str, key: bytes) -> Optional[bytes]:
+    """
+    Read one vector blob from the SQLite cache (blocking; run in a thread).
+    
+    The cache is an optimisation: any SQLite error (unopenable file,
+    "database is locked", ...) is logged and treated as a miss.
+    """
+    try:
+        conn = _get_disk_cache(path)
+        with _disk_cache_lock:
+            row = conn.execute(
+                "SELECT vector FROM embedding_cache WHERE hash = ?", (key,)
+            ).fetchone()
+    except sqlite3.Error as e:
+        logger.warning("Embedding cache read failed (%s): %s", path, e)
+        return None
+    return row[0] if row is not None else None
+
+
+def _disk_cache_put(path: str, key: bytes, model: str, blob: bytes) -> None:
+    """
+    Write one vector blob to the SQLite cache (blocking; run in a thread).
+    
+    A failed write is logged and skipped, never raised.
+    """
+    try:
+        conn = _get_disk_cache(path)
+        with _disk_cache_lock:
+            conn.execute(
+                "INSERT OR REPLACE INTO embedding_cache (hash, model, vector) "
+                "VALUES (?, ?, ?)",
+                (key, model, blob)
+            )
+            conn.commit()
+    except sqlite3.Error as e:
+        logger.warning("Embedding cache write failed (%s): %s", path, e)
+
 
 # =============================================================================
 # EXCEPTIONS
@@ -67,6 +151,18 @@ class EmbeddingsProvider(ABC):
         """
         pass
     
+    async def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get embedding vectors for several texts.
+        
+        Providers backed by a batch API should override this to embed
+        all texts in one request. The default embeds them one by one.
+        
+        Returns:
+            One embedding per input text, in input order
+        """
+        return [await self.get_embedding(text) for text in texts]
+    
     async def compute_similarity(self, text1: str, text2: str) -> float:
         """
         Compute cosine similarity between two pieces of text.
@@ -90,11 +186,109 @@ class EmbeddingsProvider(ABC):
             )
         
         # Get embeddings (SAME model for both)
-        emb1 = await self.get_embedding(text1)
-        emb2 = await self.get_embedding(text2)
+        # The original is commonly resubmitted across retries/variants;
+        # otherwise embed both texts in a single provider call.
+        emb1 = await self._cache_lookup(text1)
+        if emb1 is None:
+            emb1, emb2 = await self.get_embeddings([text1, text2])
+            emb1 = await self._cache_store(text1, emb1)
+        else:
+            emb2 = await self.get_embedding(text2)
         
         return self._cosine_similarity(emb1, emb2)
     
+    def cache_namespace(self) -> str:
+        """
+        Identify the embedding model for cache keys.
+        
+        Providers with configurable models must include the model name.
+        """
+        return type(self).__name__
+    
+    def _cache_key(self, text: str) -> bytes:
+        """Digest of model + text (the cache never holds raw text)."""
+        return hashlib.blake2b(
+            self.cache_namespace().encode("utf-8") + b"\0" + text.encode("utf-8"),
+            digest_size=16
+        ).digest()
+    
+    async def _cache_lookup(self, text: str) -> Optional[List[float]]:
+        """
+        Look up a cached original-text embedding.
+        
+        Checks the in-memory LRU, then the SQLite file if configured.
+        Always misses unless EMBEDDINGS_CACHE_SIZE > 0 or
+        EMBEDDINGS_CACHE_PATH is set.
+        """
+        settings = get_settings()
+        if settings.embeddings_cache_size <= 0 and not settings.embeddings_cache_path:
+            return None
+        
+        key = self._cache_key(text)
+        cached = _embedding_cache.get(key)
+        if cached is not None:
+            _embedding_cache.move_to_end(key)
+            return cached
+        
+        if settings.embeddings_cache_path:
+            # SQLite I/O is blocking - keep it off the event loop
+            blob = await asyncio.to_thread(
+                _disk_cache_get, settings.embeddings_cache_path, key
+            )
+            if blob is not None:
+                cached = self._decode_vector(blob)
+                self._memory_store(key, cached)
+        return cached
+    
+    async def _cache_store(self, text: str, embedding: List[float]) -> List[float]:
+        """
+        Store an original-text embedding (no-op when caching is disabled).
+        
+        Returns the embedding exactly as later lookups will return it, so a
+        miss and a hit yield the same similarity score.
+        """
+        settings = get_settings()
+        if settings.embeddings_cache_size <= 0 and not settings.embeddings_cache_path:
+            return embedding
+        
+        key = self._cache_key(text)
+        
+        if settings.embeddings_cache_path:
+            blob = self._encode_vector(embedding)
+            embedding = self._decode_vector(blob)
+            await asyncio.to_thread(
+                _disk_cache_put, settings.embeddings_cache_path,
+                key, self.cache_namespace(), blob
+            )
+        
+        self._memory_store(key, embedding)
+        return embedding
+    
+    def _memory_store(self, key: bytes, embedding: List[float]) -> None:
+        """Insert into the in-memory LRU (no-op when EMBEDDINGS_CACHE_SIZE is 0)."""
+        max_size = get_settings().embeddings_cache_size
+        if max_size <= 0:
+            return
+        
+        _embedding_cache[key] = embedding
+        while len(_embedding_cache) > max_size:
+            _embedding_cache.popitem(last=False)
+    
+    @staticmethod
+    def _encode_vector(embedding: List[float]) -> bytes:
+        """
+        Serialize a vector as raw little-endian float16 bytes (no pickle).
+        
+        Half the size of float32; cosine error stays well below the
+        3-decimal precision of reported scores.
+        """
+        return struct.pack(f"<{len(embedding)}e", *embedding)
+    
+    @staticmethod
+    def _decode_vector(blob: bytes) -> List[float]:
+        """Inverse of _encode_vector (upcast to Python floats)."""
+        return list(struct.unpack(f"<{len(blob) // 2}e", blob))
+    
     def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """
         Compute cosine similarity between two vectors.
@@ -107,14 +301,22 @@ class EmbeddingsProvider(ABC):
                 internal_reason=f"Dimensions: {len(vec1)} vs {len(vec2)}"
             )
         
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        magnitude1 = math.sqrt(sum(a * a for a in vec1))
-        magnitude2 = math.sqrt(sum(b * b for b in vec2))
+        if simsimd is not None:
+            # Zero vectors are defined as similarity 0.0 (see fallback below)
+            if not any(vec1) or not any(vec2):
+                return 0.0
+            # float64 buffers keep results identical to the fallback path
+            distance = simsimd.cosine(array("d", vec1), array("d", vec2))
+            return max(0.0, min(1.0, 1.0 - float(distance)))
         
-        if magnitude1 == 0 or magnitude2 == 0:
+        # map(operator.mul) keeps the products in C; one sqrt for both norms
+        dot_product = sum(map(operator.mul, vec1, vec2))
+        norm_product = sum(map(operator.mul, vec1, vec1)) * sum(map(operator.mul, vec2, vec2))
+        
+        if norm_product == 0:
             return 0.0
         
-        similarity = dot_product / (magnitude1 * magnitude2)
+        similarity = dot_product / math.sqrt(norm_product)
         
         # Clamp to [0, 1] range (cosine can be negative for opposing vectors)
         return max(0.0, min(1.0, similarity))
@@ -140,6 +342,9 @@ class PlaceholderEmbeddingsProvider(EmbeddingsProvider):
     def __init__(self, dimensions: int = 128):
         self.dimensions = dimensions
     
+    def cache_namespace(self) -> str:
+        return f"placeholder:{self.dimensions}"
+    
     async def get_embedding(self, text: str) -> List[float]:
         """
         Generate a placeholder embedding based on character frequencies.
@@ -211,6 +416,9 @@ class OpenAIEmbeddingsProvider(EmbeddingsProvider):
         self.client = AsyncOpenAI(api_key=api_key)
         self.model = model
     
+    def cache_namespace(self) -> str:
+        return f"openai:{self.model}"
+    
     async def get_embedding(self, text: str) -> List[float]:
         """Get embedding from OpenAI API."""
         if not text or not text.strip():
@@ -231,6 +439,28 @@ class OpenAIEmbeddingsProvider(EmbeddingsProvider):
                 "Failed to compute text embedding. Please try again.",
                 internal_reason=f"OpenAI API error: {type(e).__name__}: {e}"
             )
+    
+    async def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for several texts in one OpenAI API request."""
+        if any(not text or not text.strip() for text in texts):
+            raise EmbeddingsError(
+                "Cannot embed empty text",
+                internal_reason="Empty input to get_embeddings"
+            )
+        
+        try:
+            response = await self.client.embeddings.create(
+                model=self.model,
+                input=[text.strip() for text in texts]
+            )
+            # Results carry their input index; don't rely on response order
+            return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+            
+        except Exception as e:
+            raise EmbeddingsError(
+                "Failed to compute text embedding. Please try again.",
+                internal_reason=f"OpenAI API error: {type(e).__name__}: {e}"
+            )
 
 
 # =============================================================================
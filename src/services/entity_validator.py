@@ -16,34 +16,36 @@ This validator catches what embeddings miss.
 """
 
 import re
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Tuple
 from dataclasses import dataclass, field
 
+from .analysis_cache import AnalysisMemo
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class EntityExtractionResult:
-    """Result of entity extraction from text."""
-    numbers: List[str] = field(default_factory=list)
-    percentages: List[str] = field(default_factory=list)
-    dates: List[str] = field(default_factory=list)
-    years: List[str] = field(default_factory=list)
-    proper_nouns: List[str] = field(default_factory=list)
-    citations: List[str] = field(default_factory=list)
+    """Result of entity extraction from text (frozen, so memoized results can be shared)."""
+    numbers: Tuple[str, ...] = ()
+    percentages: Tuple[str, ...] = ()
+    dates: Tuple[str, ...] = ()
+    years: Tuple[str, ...] = ()
+    proper_nouns: Tuple[str, ...] = ()
+    citations: Tuple[str, ...] = ()
     
     def all_entities(self) -> Set[str]:
         """Get all entities as a set for comparison."""
-        all_items = (
-            self.numbers + 
-            self.percentages + 
-            self.dates + 
-            self.years + 
-            self.proper_nouns + 
+        # set.union takes the lists directly (no concatenated temporary)
+        return set().union(
+            self.numbers,
+            self.percentages,
+            self.dates,
+            self.years,
+            self.proper_nouns,
             self.citations
         )
-        return set(all_items)
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityValidationResult:
     """Result of entity preservation validation."""
     preserved: bool
@@ -112,18 +114,24 @@ class EntityValidator:
             
         Returns:
             EntityExtractionResult with all extracted entities
+            
+        Memoized when ANALYSIS_CACHE_SIZE > 0 (see analysis_cache).
         """
+        return _extraction_memo.get_or_compute(
+            type(self), text, lambda: self._extract_uncached(text)
+        )
+    
+    def _extract_uncached(self, text: str) -> EntityExtractionResult:
+        """Run the full entity extraction (see extract_entities)."""
         if not text or not text.strip():
             return EntityExtractionResult()
         
-        result = EntityExtractionResult()
-        
         # Extract each entity type
-        result.percentages = re.findall(self.PATTERNS["percentages"], text)
-        result.numbers = re.findall(self.PATTERNS["numbers"], text)
-        result.dates = re.findall(self.PATTERNS["dates"], text, re.IGNORECASE)
-        result.years = re.findall(self.PATTERNS["years"], text)
-        result.citations = re.findall(self.PATTERNS["citations"], text)
+        percentages = re.findall(self.PATTERNS["percentages"], text)
+        numbers = re.findall(self.PATTERNS["numbers"], text)
+        dates = re.findall(self.PATTERNS["dates"], text, re.IGNORECASE)
+        years = re.findall(self.PATTERNS["years"], text)
+        citations = re.findall(self.PATTERNS["citations"], text)
         
         # Proper nouns - more careful extraction
         # Exclude common words that might be capitalized
@@ -135,12 +143,19 @@ class EntityValidator:
         }
         
         proper_noun_matches = re.findall(self.PATTERNS["proper_nouns"], text)
-        result.proper_nouns = [
+        proper_nouns = [
             pn for pn in proper_noun_matches 
             if pn not in common_words and len(pn) > 2
         ]
         
-        return result
+        return EntityExtractionResult(
+            numbers=tuple(numbers),
+            percentages=tuple(percentages),
+            dates=tuple(dates),
+            years=tuple(years),
+            proper_nouns=tuple(proper_nouns),
+            citations=tuple(citations)
+        )
     
     def validate(
         self, 
@@ -157,9 +172,51 @@ class EntityValidator:
         Returns:
             EntityValidationResult with preservation status
         """
-        orig_entities = self.extract_entities(original_text)
-        prop_entities = self.extract_entities(proposed_text)
+        return self._compare(
+            self.extract_entities(original_text),
+            self.extract_entities(proposed_text)
+        )
+    
+    def validate_batch(
+        self,
+        originals: List[str],
+        proposals: List[str]
+    ) -> List[EntityValidationResult]:
+        """
+        Validate many (original, proposed) pairs in one call.
+        
+        Used when several proposals are scored together (ranking, A/B).
+        Each distinct text is extracted only once, so an original shared
+        across many proposals costs a single regex pass.
+        
+        Args:
+            originals: Original texts, one per pair
+            proposals: Proposed rewrites, aligned with originals
+            
+        Returns:
+            List of EntityValidationResult, in input order
+        """
+        if len(originals) != len(proposals):
+            raise ValueError(
+                f"Batch size mismatch: {len(originals)} originals vs {len(proposals)} proposals"
+            )
         
+        extracted: Dict[str, EntityExtractionResult] = {}
+        for text in (*originals, *proposals):
+            if text not in extracted:
+                extracted[text] = self.extract_entities(text)
+        
+        return [
+            self._compare(extracted[orig], extracted[prop])
+            for orig, prop in zip(originals, proposals)
+        ]
+    
+    def _compare(
+        self,
+        orig_entities: EntityExtractionResult,
+        prop_entities: EntityExtractionResult
+    ) -> EntityValidationResult:
+        """Diff two extraction results into a validation result."""
         orig_set = orig_entities.all_entities()
         prop_set = prop_entities.all_entities()
         
@@ -202,19 +259,19 @@ class EntityValidator:
         
         Example: "50%" → "60%" is a change, not add/remove.
         """
-        changes = []
-        
         # If same count of numbers but different values, likely a change
-        if len(orig_numbers) == len(prop_numbers) and len(orig_numbers) > 0:
-            for orig, prop in zip(sorted(orig_numbers), sorted(prop_numbers)):
-                if orig != prop:
-                    changes.append({
-                        "original": orig,
-                        "proposed": prop,
-                        "type": "number_change"
-                    })
-        
-        return changes
+        if len(orig_numbers) != len(prop_numbers) or not orig_numbers:
+            return []
+        
+        return [
+            {
+                "original": orig,
+                "proposed": prop,
+                "type": "number_change"
+            }
+            for orig, prop in zip(sorted(orig_numbers), sorted(prop_numbers))
+            if orig != prop
+        ]
     
     def _compute_risk_level(
         self, 
@@ -238,3 +295,7 @@ class EntityValidator:
             return "low"
         
         return "none"
+
+
+# Shared by all validators (they are stateless)
+_extraction_memo: "AnalysisMemo[EntityExtractionResult]" = AnalysisMemo("entities")
@@ -4,11 +4,52 @@ AI PROMPTING LAYER: Google Gemini Provider
 Production-grade AI proposal generation using Google Gemini models.
 """
 
-import json
+import orjson
+from functools import lru_cache
 from typing import Literal
 from ..config import get_settings
 from .ai_provider import AIProvider, AIProposal, AIProposalError, SanityChecker, SYSTEM_INSTRUCTION, INTENT_MODIFIERS
 
+# Optional SDK, resolved once per process
+try:
+    import google.generativeai as _genai
+    _HAS_GENAI = True
+except ImportError:
+    _genai = None
+    _HAS_GENAI = False
+
+# genai.configure() is process-global; only redo it when the key changes
+_configured_api_key = None
+
+
+def _configure(api_key: str) -> None:
+    """Configure the Gemini SDK once per API key."""
+    global _configured_api_key
+    if _configured_api_key != api_key:
+        _genai.configure(api_key=api_key)
+        _configured_api_key = api_key
+        # Pooled models may hold a client bound to the previous key
+        _get_model.cache_clear()
+
+
+@lru_cache(maxsize=8)
+def _get_model(model_name: str, system_instruction: str):
+    """Shared GenerativeModel per (model, system instruction)."""
+    return _genai.GenerativeModel(
+        model_name=model_name,
+        system_instruction=system_instruction
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_generation_config():
+    """Shared JSON generation config (low temperature for conservative output)."""
+    return _genai.GenerationConfig(
+        temperature=0.3,
+        response_mime_type="application/json"
+    )
+
+
 class GeminiProvider(AIProvider):
     """
     Production AI provider using Google Gemini.
@@ -24,28 +65,19 @@ class GeminiProvider(AIProvider):
             api_key: Google API key
             model: Model to use (default: gemini-1.5-flash)
         """
-        try:
-            import google.generativeai as genai
-        except ImportError:
+        if not _HAS_GENAI:
             raise AIProposalError(
                 "Google Generative AI integration not available",
                 internal_reason="google-generativeai package not installed"
             )
         
-        genai.configure(api_key=api_key)
+        _configure(api_key)
         self.model_name = model
         self.sanity_checker = SanityChecker()
         
         # Configure model with generation config for JSON
-        self.model = genai.GenerativeModel(
-            model_name=model,
-            system_instruction=SYSTEM_INSTRUCTION
-        )
-        
-        self.generation_config = genai.GenerationConfig(
-            temperature=0.3,
-            response_mime_type="application/json"
-        )
+        self.model = _get_model(model, SYSTEM_INSTRUCTION)
+        self.generation_config = _get_generation_config()
     
     async def generate_proposal(
         self,
@@ -65,17 +97,36 @@ TEXT TO REVISE:
 Remember: Output ONLY valid JSON with "proposed_text" and "explanation_summary" fields."""
         
         try:
-            # Gemini async generation
-            response = await self.model.generate_content_async(
+            # Gemini async generation (streamed, so we can start consuming
+            # output at first token instead of waiting for the full response)
+            stream = await self.model.generate_content_async(
                 user_message,
-                generation_config=self.generation_config
+                generation_config=self.generation_config,
+                stream=True
             )
-            
-            response_text = response.text
-            
+
+            chunks = []
+            seen_content = False
+            async for chunk in stream:
+                text_part = chunk.text
+                # Fail fast if the output is clearly not a JSON object
+                # (no need to wait for the rest of the generation)
+                if not seen_content:
+                    stripped = text_part.lstrip()
+                    if stripped:
+                        seen_content = True
+                        if not stripped.startswith("{"):
+                            raise AIProposalError(
+                                "AI returned invalid format. Please try again.",
+                                internal_reason=f"Non-JSON stream prefix: {text_part[:200]}"
+                            )
+                chunks.append(text_part)
+
+            response_text = "".join(chunks)
+
             try:
-                result = json.loads(response_text)
-            except json.JSONDecodeError:
+                result = orjson.loads(response_text)
+            except orjson.JSONDecodeError:
                 raise AIProposalError(
                     "AI returned invalid format. Please try again.",
                     internal_reason=f"JSON parse failed: {response_text[:200]}"
@@ -151,8 +151,9 @@ class InputValidator:
         This is intentionally basic for MVP.
         """
         # Check for excessive newlines
-        newline_count = text.count('\n')
-        if newline_count > MAX_NEWLINES:
+        # (a text can't hold more newlines than characters, so skip the scan
+        # when it is too short to exceed the limit)
+        if len(text) > MAX_NEWLINES and text.count('\n') > MAX_NEWLINES:
             raise InputValidationError(
                 "Input appears to be a full document section. "
                 "PolyWrite works on selected passages. "
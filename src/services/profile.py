@@ -3,6 +3,7 @@ PHASE 1 & 3: Profile Service
 Handles profile CRUD and role-based access control.
 """
 
+import asyncio
 from uuid import UUID
 from typing import Optional
 from supabase import Client
@@ -21,7 +22,10 @@ class ProfileService:
         Fetch a user's profile by ID.
         Returns None if profile doesn't exist.
         """
-        result = self.supabase.table("profiles").select("*").eq("id", str(user_id)).single().execute()
+        # Supabase client is synchronous; keep network I/O off the event loop
+        result = await asyncio.to_thread(
+            self.supabase.table("profiles").select("*").eq("id", str(user_id)).single().execute
+        )
         
         if result.data:
             return Profile(**result.data)
@@ -41,17 +45,21 @@ class ProfileService:
         
         # Profile missing - create it
         # This should rarely happen due to the database trigger,
-        # but we handle it defensively
-        result = self.supabase.table("profiles").upsert({
-            "id": str(user_id),
-            "email": email,
-            "role": "free"
-        }).execute()
-        
-        # Also create rate limit entry
-        self.supabase.table("rate_limits").upsert({
-            "user_id": str(user_id)
-        }).execute()
+        # but we handle it defensively.
+        # The rate limit row references profiles(id), so the profile must
+        # be written first.
+        result = await asyncio.to_thread(
+            self.supabase.table("profiles").upsert({
+                "id": str(user_id),
+                "email": email,
+                "role": "free"
+            }).execute
+        )
+        await asyncio.to_thread(
+            self.supabase.table("rate_limits").upsert({
+                "user_id": str(user_id)
+            }).execute
+        )
         
         return Profile(**result.data[0])
     
@@ -101,9 +109,11 @@ class ProfileService:
         if new_role not in ("free", "internal"):
             raise ValueError(f"Invalid role: {new_role}")
         
-        result = self.supabase.table("profiles").update({
-            "role": new_role
-        }).eq("id", str(user_id)).execute()
+        result = await asyncio.to_thread(
+            self.supabase.table("profiles").update({
+                "role": new_role
+            }).eq("id", str(user_id)).execute
+        )
         
         if not result.data:
             raise ValueError(f"User {user_id} not found")
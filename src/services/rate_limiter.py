@@ -23,8 +23,8 @@ LIMITS (CONFIGURABLE VIA ENV):
 - Per-day: 50 (long-term abuse protection)
 """
 
+import asyncio
 from uuid import UUID
-from datetime import datetime, timedelta
 from supabase import Client
 
 from ..config import get_settings
@@ -78,7 +78,7 @@ class RateLimiter:
     - Any operation that triggers embedding generation
     - UI interactions that do NOT call AI do NOT count
     
-    RESET LOGIC:
+    RESET LOGIC (enforced in the database, see consume_rate_limit):
     - Per-minute counters reset every 60 seconds
     - Per-day counters reset at UTC day boundary
     
@@ -89,6 +89,10 @@ class RateLimiter:
     def __init__(self, supabase: Client):
         self.supabase = supabase
         self.settings = get_settings()
+        
+        # Bind limits once; check_and_increment runs before every AI call
+        self._rpm = self.settings.rate_limit_requests_per_minute
+        self._rpd = self.settings.rate_limit_requests_per_day
     
     async def check_and_increment(self, user: UserContext) -> None:
         """
@@ -103,70 +107,29 @@ class RateLimiter:
         if user.role == "internal":
             return
         
-        # Fetch current rate limit state
-        result = self.supabase.table("rate_limits").select("*").eq(
-            "user_id", str(user.user_id)
-        ).execute()
-        
-        if not result.data:
-            # No rate limit record - create one
-            self.supabase.table("rate_limits").insert({
-                "user_id": str(user.user_id),
-                "requests_today": 1,
-                "requests_this_minute": 1,
-                "last_minute_reset": datetime.utcnow().isoformat(),
-                "last_day_reset": datetime.utcnow().date().isoformat()
-            }).execute()
-            return
-        
-        data = result.data[0]
-        now = datetime.utcnow()
-        
-        # Parse timestamps (handle various formats)
-        last_minute_reset = self._parse_timestamp(data["last_minute_reset"])
-        last_day_reset = datetime.strptime(data["last_day_reset"], "%Y-%m-%d").date()
-        
-        requests_this_minute = data["requests_this_minute"]
-        requests_today = data["requests_today"]
-        
-        # Check if we need to reset counters
-        minute_reset_needed = (now - last_minute_reset) > timedelta(minutes=1)
-        day_reset_needed = now.date() > last_day_reset
-        
-        if minute_reset_needed:
-            requests_this_minute = 0
-            last_minute_reset = now
-        
-        if day_reset_needed:
-            requests_today = 0
-            last_day_reset = now.date()
+        # Check and increment in ONE atomic database call (see
+        # consume_rate_limit in database/schema.sql; existing databases get
+        # it from database/migrations/001_consume_rate_limit.sql): concurrent
+        # requests can't both pass on the same stale count
+        # (Supabase client is synchronous; keep network I/O off the event loop)
+        result = await asyncio.to_thread(
+            self.supabase.rpc("consume_rate_limit", {
+                "p_user_id": str(user.user_id),
+                "p_per_minute": self._rpm,
+                "p_per_day": self._rpd
+            }).execute
+        )
         
         # =====================================================================
         # HARD LIMIT ENFORCEMENT (NO GRACE PERIOD)
         # =====================================================================
         
-        if requests_this_minute >= self.settings.rate_limit_requests_per_minute:
-            seconds_until_reset = 60 - (now - last_minute_reset).seconds
-            raise RateLimitExceeded("minute", retry_after_seconds=max(1, seconds_until_reset))
-        
-        if requests_today >= self.settings.rate_limit_requests_per_day:
-            raise RateLimitExceeded("day", retry_after_seconds=None)
-        
-        # Increment counters (only if limits not exceeded)
-        self.supabase.table("rate_limits").update({
-            "requests_this_minute": requests_this_minute + 1,
-            "requests_today": requests_today + 1,
-            "last_minute_reset": last_minute_reset.isoformat(),
-            "last_day_reset": last_day_reset.isoformat()
-        }).eq("user_id", str(user.user_id)).execute()
-    
-    def _parse_timestamp(self, ts: str) -> datetime:
-        """Parse timestamp string handling various formats."""
-        # Remove timezone suffixes for naive datetime
-        ts = ts.replace("Z", "").replace("+00:00", "")
-        if "." in ts:
-            return datetime.fromisoformat(ts.split(".")[0])
-        return datetime.fromisoformat(ts)
+        verdict = result.data[0]
+        if not verdict["allowed"]:
+            raise RateLimitExceeded(
+                verdict["limit_type"],
+                retry_after_seconds=verdict["retry_after_seconds"]
+            )
     
     async def get_usage(self, user: UserContext) -> dict:
         """
@@ -174,16 +137,18 @@ class RateLimiter:
         
         For UI display only - does NOT influence limits.
         """
-        result = self.supabase.table("rate_limits").select("*").eq(
-            "user_id", str(user.user_id)
-        ).execute()
+        result = await asyncio.to_thread(
+            self.supabase.table("rate_limits").select("*").eq(
+                "user_id", str(user.user_id)
+            ).execute
+        )
         
         if not result.data:
             return {
                 "requests_this_minute": 0,
                 "requests_today": 0,
-                "limit_per_minute": self.settings.rate_limit_requests_per_minute,
-                "limit_per_day": self.settings.rate_limit_requests_per_day,
+                "limit_per_minute": self._rpm,
+                "limit_per_day": self._rpd,
                 "bypassed": user.role == "internal"
             }
         
@@ -191,8 +156,8 @@ class RateLimiter:
         return {
             "requests_this_minute": data["requests_this_minute"],
             "requests_today": data["requests_today"],
-            "limit_per_minute": self.settings.rate_limit_requests_per_minute,
-            "limit_per_day": self.settings.rate_limit_requests_per_day,
+            "limit_per_minute": self._rpm,
+            "limit_per_day": self._rpd,
             "bypassed": user.role == "internal"
         }
 
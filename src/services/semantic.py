@@ -30,9 +30,14 @@ OUTPUT CONTRACT:
 }
 """
 
+import asyncio
+import re
+from typing import List, Sequence, Tuple, Union
+
 from ..config import get_settings
 from ..models.schemas import SemanticResult
 from .embeddings import EmbeddingsProvider, EmbeddingsError
+from .text_preprocessing import PreprocessedText, preprocess
 
 
 # =============================================================================
@@ -75,12 +80,21 @@ class SemanticValidator:
     """
     
     # Negation words for polarity detection
-    NEGATION_WORDS = {
+    NEGATION_WORDS = frozenset({
         'not', 'no', 'never', 'neither', 'nor', 'none', 'nobody', 
         'nothing', 'nowhere', "n't", "cannot", "can't", "won't", 
         "wouldn't", "shouldn't", "couldn't", "doesn't", "don't",
         "didn't", "isn't", "aren't", "wasn't", "weren't"
-    }
+    })
+    
+    # One scan per text: whole-word negations (so "not." and "(never)" count)
+    # plus any contracted "n't", which covers every apostrophe form above.
+    # Matched against lowercased text.
+    NEGATION_RE = re.compile(
+        r"\b(?:"
+        + "|".join(re.escape(w) for w in sorted(NEGATION_WORDS) if "'" not in w)
+        + r")\b|n't"
+    )
     
     def __init__(self, embeddings_provider: EmbeddingsProvider):
         """
@@ -98,6 +112,13 @@ class SemanticValidator:
         self.entity_validator = EntityValidator()
         self.claim_validator = ClaimValidator()
         self.tone_analyzer = ToneAnalyzer()
+        
+        # Risk label for every (polarity_flip, >= safe, entity_preserved,
+        # >= risky) combination, indexed by those bits in that order
+        self._risk_lut = [
+            self._risk_rule(bool(i & 8), bool(i & 4), bool(i & 2), bool(i & 1))
+            for i in range(16)
+        ]
     
     async def validate(
         self, 
@@ -108,9 +129,10 @@ class SemanticValidator:
         Compare original and proposed text semantically.
         
         This function performs:
-        1. Embedding-based similarity check
-        2. Entity preservation check (white paper 4.4)
-        3. Polarity flip detection (white paper 4.5)
+        1. Polarity flip detection (white paper 4.5)
+        2. Embedding-based similarity check
+        3. Entity preservation check (white paper 4.4)
+        4-5. Claim and tone checks (skipped if polarity flipped)
         
         Args:
             original_text: The user's original text
@@ -137,20 +159,45 @@ class SemanticValidator:
         
         validation_flags = []
         
-        # Step 1: Compute semantic similarity using embeddings
+        # Lowercase each text once for the validators that need it
+        original_pre = PreprocessedText.from_text(original_text)
+        proposed_pre = PreprocessedText.from_text(proposed_text)
+        
+        # Step 1: Polarity flip detection (white paper 4.5)
+        # Runs first: it is one regex scan per text, and a flip makes the
+        # result "dangerous" whatever the other validators report.
+        polarity_flip = self._detect_polarity_flip(original_pre, proposed_pre)
+        
+        # Steps 2-5 run concurrently: the embedding call (network-bound) is
+        # in flight while the regex validators run in worker threads.
+        # Claim and tone analysis are skipped once polarity has flipped;
+        # similarity and entities are still reported.
+        steps = [
+            # Step 2: Compute semantic similarity using embeddings
+            self.embeddings.compute_similarity(original_text, proposed_text),
+            # Step 3: Entity preservation check (white paper 4.4)
+            asyncio.to_thread(self.entity_validator.validate, original_text, proposed_text),
+        ]
+        if not polarity_flip:
+            steps += [
+                # Step 4: Claim and citation analysis (white paper 4.6)
+                asyncio.to_thread(self.claim_validator.validate, original_text, proposed_text),
+                # Step 5: Tone preservation check (white paper 9.1)
+                asyncio.to_thread(self.tone_analyzer.validate, original_pre, proposed_pre),
+            ]
+        
         try:
-            similarity_score = await self.embeddings.compute_similarity(
-                original_text, 
-                proposed_text
-            )
+            results = await asyncio.gather(*steps)
         except EmbeddingsError as e:
             raise SemanticValidationError(
                 "Failed to compute semantic similarity",
                 internal_reason=e.internal_reason
             )
         
-        # Step 2: Entity preservation check (white paper 4.4)
-        entity_result = self.entity_validator.validate(original_text, proposed_text)
+        similarity_score, entity_result = results[0], results[1]
+        claim_result = results[2] if not polarity_flip else None
+        tone_result = results[3] if not polarity_flip else None
+        
         entity_preserved = entity_result.preserved
         
         if not entity_preserved:
@@ -164,22 +211,15 @@ class SemanticValidator:
                         f"Number changed: {change['original']} → {change['proposed']}"
                     )
         
-        # Step 3: Polarity flip detection (white paper 4.5)
-        polarity_flip = self._detect_polarity_flip(original_text, proposed_text)
-        
         if polarity_flip:
             validation_flags.append("Polarity reversal detected (negation changed)")
         
-        # Step 4: Claim and citation analysis (white paper 4.6)
-        claim_result = self.claim_validator.validate(original_text, proposed_text)
-        if claim_result.uncited_claims:
+        if claim_result is not None and claim_result.uncited_claims:
             validation_flags.append(
                 f"Uncited claims: {len(claim_result.uncited_claims)} detected"
             )
         
-        # Step 5: Tone preservation check (white paper 9.1)
-        tone_result = self.tone_analyzer.validate(original_text, proposed_text)
-        if not tone_result.preserved:
+        if tone_result is not None and not tone_result.preserved:
             validation_flags.append(
                 f"Tone shift: {tone_result.original_tone} → {tone_result.proposed_tone}"
             )
@@ -192,9 +232,11 @@ class SemanticValidator:
         )
         
         # Build response objects
+        # (model_construct: fields come from our own validators and are
+        # already well-typed; request input is validated at the API boundary)
         from ..models.schemas import EntityPreservation, ClaimAnalysis, ToneAnalysis
         
-        entity_details = EntityPreservation(
+        entity_details = EntityPreservation.model_construct(
             preserved=entity_result.preserved,
             missing=entity_result.missing,
             added=entity_result.added,
@@ -202,23 +244,29 @@ class SemanticValidator:
             risk_level=entity_result.risk_level
         )
         
-        claim_analysis = ClaimAnalysis(
-            claims_detected=len(claim_result.claims_detected),
-            uncited_claims=claim_result.uncited_claims[:5],
-            citation_count=claim_result.citation_count,
-            risk_level=claim_result.risk_level,
-            needs_review=len(claim_result.uncited_claims) > 0
-        )
+        # Not computed when polarity flipped (reported as None)
+        claim_analysis = None
+        tone_analysis = None
         
-        tone_analysis = ToneAnalysis(
-            preserved=tone_result.preserved,
-            original_tone=tone_result.original_tone,
-            proposed_tone=tone_result.proposed_tone,
-            formality_shift=tone_result.formality_shift,
-            risk_level=tone_result.risk_level
-        )
+        if claim_result is not None:
+            claim_analysis = ClaimAnalysis.model_construct(
+                claims_detected=len(claim_result.claims_detected),
+                uncited_claims=claim_result.uncited_claims[:5],
+                citation_count=claim_result.citation_count,
+                risk_level=claim_result.risk_level,
+                needs_review=len(claim_result.uncited_claims) > 0
+            )
+        
+        if tone_result is not None:
+            tone_analysis = ToneAnalysis.model_construct(
+                preserved=tone_result.preserved,
+                original_tone=tone_result.original_tone,
+                proposed_tone=tone_result.proposed_tone,
+                formality_shift=tone_result.formality_shift,
+                risk_level=tone_result.risk_level
+            )
         
-        return SemanticResult(
+        return SemanticResult.model_construct(
             similarity_score=round(similarity_score, 3),
             risk_label=risk_label,
             entity_preserved=entity_preserved,
@@ -229,7 +277,29 @@ class SemanticValidator:
             tone_analysis=tone_analysis
         )
     
-    def _detect_polarity_flip(self, original: str, proposed: str) -> bool:
+    async def validate_batch(
+        self,
+        pairs: Sequence[Tuple[str, str]]
+    ) -> List[SemanticResult]:
+        """
+        Validate several (original, proposed) pairs concurrently.
+        
+        Each pair goes through validate() unchanged, so embeddings calls
+        overlap instead of running back to back. Results are in input order.
+        
+        Raises:
+            SemanticValidationError: If any pair cannot be validated
+        """
+        return list(await asyncio.gather(*[
+            self.validate(original, proposed)
+            for original, proposed in pairs
+        ]))
+    
+    def _detect_polarity_flip(
+        self,
+        original: Union[str, PreprocessedText],
+        proposed: Union[str, PreprocessedText]
+    ) -> bool:
         """
         Detect if proposed text reverses the polarity of the original.
         
@@ -239,20 +309,13 @@ class SemanticValidator:
         
         Returns True if negation status changed.
         """
-        orig_lower = original.lower()
-        prop_lower = proposed.lower()
-        
-        # Count negation words in each text
-        orig_negations = sum(1 for word in self.NEGATION_WORDS if word in orig_lower.split())
-        prop_negations = sum(1 for word in self.NEGATION_WORDS if word in prop_lower.split())
-        
-        # Also check for contracted negations within words
-        orig_has_nt = "n't" in orig_lower
-        prop_has_nt = "n't" in prop_lower
+        # Lowercase form is shared with the other validators
+        orig_lower = preprocess(original).lower
+        prop_lower = preprocess(proposed).lower
         
         # Polarity flip if one has negation and the other doesn't
-        orig_is_negated = (orig_negations > 0) or orig_has_nt
-        prop_is_negated = (prop_negations > 0) or prop_has_nt
+        orig_is_negated = self.NEGATION_RE.search(orig_lower) is not None
+        prop_is_negated = self.NEGATION_RE.search(prop_lower) is not None
         
         return orig_is_negated != prop_is_negated
     
@@ -275,19 +338,36 @@ class SemanticValidator:
         - 0.60 <= similarity < 0.85 → "risky"  
         - similarity < 0.60     → "dangerous"
         """
+        # Decisions are precomputed in __init__ (see _risk_rule)
+        idx = (
+            (polarity_flip << 3)
+            | ((similarity >= self.settings.threshold_safe) << 2)
+            | (entity_preserved << 1)
+            | (similarity >= self.settings.threshold_risky)
+        )
+        return self._risk_lut[idx]
+    
+    @staticmethod
+    def _risk_rule(
+        polarity_flip: bool,
+        ge_safe: bool,
+        entity_preserved: bool,
+        ge_risky: bool
+    ) -> str:
+        """Risk label for one combination of threshold/validator outcomes."""
         # WHITE PAPER: Polarity flip ALWAYS blocks, regardless of similarity
         if polarity_flip:
             return "dangerous"
         
         # WHITE PAPER 4.4: High similarity BUT entity changed → dangerous
         # This catches "50% in 2020" → "60% in 2021" (similarity 0.92 but wrong)
-        if similarity >= self.settings.threshold_safe and not entity_preserved:
+        if ge_safe and not entity_preserved:
             return "dangerous"
         
         # Standard threshold-based classification
-        if similarity >= self.settings.threshold_safe and entity_preserved:
+        if ge_safe and entity_preserved:
             return "safe"
-        elif similarity >= self.settings.threshold_risky:
+        elif ge_risky:
             return "risky"
         else:
             return "dangerous"
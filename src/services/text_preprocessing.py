@@ -0,0 +1,47 @@
+"""
+Shared Text Preprocessing
+
+Lowercasing is computed ONCE per text and shared by every validator
+that needs it, instead of each validator re-lowercasing the same
+original/proposed text.
+
+USED BY:
+- SemanticValidator polarity detection (lowercased text)
+- ToneAnalyzer (lowercased text, character count)
+
+Entity and claim extraction match case-sensitive patterns against the
+raw text, so they keep taking the text unchanged.
+"""
+
+from dataclasses import dataclass
+from typing import Union
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class PreprocessedText:
+    """A text with its lowercase form and length."""
+    text: str
+    lower: str
+    char_count: int
+
+    # Identity is the source text: str caches its hash, so instances are
+    # cheap memo keys (everything else is derived from the text)
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PreprocessedText):
+            return self.text == other.text
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.text)
+
+    @classmethod
+    def from_text(cls, text: str) -> "PreprocessedText":
+        """Lowercase text once."""
+        return cls(text=text, lower=text.lower(), char_count=len(text))
+
+
+def preprocess(text: Union[str, PreprocessedText]) -> PreprocessedText:
+    """Accept either raw or already-preprocessed text."""
+    if isinstance(text, PreprocessedText):
+        return text
+    return PreprocessedText.from_text(text)
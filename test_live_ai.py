@@ -2,38 +2,90 @@
 import httpx
 import asyncio
 import json
+import os
+import orjson
+import statistics
+import time
+from collections import Counter
 from generate_token import generate_test_token
 
+# HTTP/2 multiplexes the concurrent run over one connection when the server
+# negotiates it (TLS deployments); needs the optional h2 package
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+BASE_URL = "http://127.0.0.1:8000"
+
+# Concurrent requests for the latency run (rate limits apply unless the
+# token belongs to an "internal" user)
+CONCURRENCY = int(os.getenv("LIVE_AI_CONCURRENCY", "8"))
+
+
+async def _timed_post(client: httpx.AsyncClient, url: str, body: bytes, headers: dict):
+    """POST a pre-serialized JSON body and return (response, elapsed seconds)."""
+    start = time.perf_counter()
+    response = await client.post(url, content=body, headers=headers)
+    return response, time.perf_counter() - start
+
+
 async def test_live():
     # Read valid token from file
     with open("valid_token.txt", "r") as f:
         token = f.read().strip()
-    url = "http://127.0.0.1:8000/api/rewrite"
-    
+    url = f"{BASE_URL}/api/rewrite"
+
     headers = {
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json"
     }
-    
+
     payload = {
         "selected_text": "the ai is working i hope",
         "intent": "humanize"
     }
-    
+    # Serialized once; every request below sends the same bytes
+    body = orjson.dumps(payload)
+
     # Increase timeout for AI models
     timeout = httpx.Timeout(30.0)
-    
-    async with httpx.AsyncClient(timeout=timeout) as client:
+
+    # One pooled client so timings measure the server, not connection setup
+    limits = httpx.Limits(
+        max_keepalive_connections=32,
+        max_connections=32,
+        keepalive_expiry=60
+    )
+
+    async with httpx.AsyncClient(timeout=timeout, limits=limits, http2=HTTP2_AVAILABLE) as client:
         try:
+            # Warm up the pooled connection
+            await client.get(f"{BASE_URL}/health")
+
             print("Sending request...")
-            response = await client.post(url, json=payload, headers=headers)
-            print(f"Status: {response.status_code}")
+            response, elapsed = await _timed_post(client, url, body, headers)
+            print(f"Status: {response.status_code} ({elapsed * 1000:.0f} ms)")
             if response.status_code == 200:
                 print("Response Body:")
                 print(json.dumps(response.json(), indent=2))
             else:
                 print("Error Body:")
                 print(response.text)
+
+            print(f"\nSending {CONCURRENCY} concurrent requests...")
+            results = await asyncio.gather(*[
+                _timed_post(client, url, body, headers)
+                for _ in range(CONCURRENCY)
+            ])
+
+            statuses = Counter(r.status_code for r, _ in results)
+            latencies = sorted(elapsed for _, elapsed in results)
+            p50 = statistics.median(latencies)
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            print(f"Statuses: {dict(statuses)}")
+            print(f"Latency p50: {p50 * 1000:.0f} ms, p95: {p95 * 1000:.0f} ms")
         except Exception as e:
             print(f"Request failed: {e}")
 
@@ -0,0 +1,56 @@
+"""
+Shared pytest configuration for the PolyWrite test suite.
+"""
+
+from uuid import uuid4
+
+import orjson
+import pytest
+
+
+@pytest.fixture(scope="session")
+def auth_headers():
+    """Bearer headers for the shared test user, issued once per session."""
+    # Imported lazily: the helpers import the app, which only API tests need
+    from .helpers import get_auth_token
+    return {"Authorization": f"Bearer {get_auth_token()}"}
+
+
+@pytest.fixture
+def throwaway_auth():
+    """
+    Bearer headers for a fresh, single-use user.
+    
+    For tests that drain a rate-limit quota, so the shared user's quota
+    (and any test running beside them) is untouched.
+    """
+    from .helpers import create_test_token
+    user_id = str(uuid4())
+    token = create_test_token(user_id, f"rl-{user_id}@test.example.com")
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture(scope="session")
+def sample_rewrite(auth_headers):
+    """
+    One successful /api/rewrite response (parsed JSON), shared by tests
+    that only assert on response fields.
+    """
+    from .helpers import client
+    response = client.post("/api/rewrite",
+        headers=auth_headers,
+        json={
+            "selected_text": "The quick brown fox jumps over the lazy dog in the meadow.",
+            "intent": "rewrite"
+        }
+    )
+    assert response.status_code == 200
+    return orjson.loads(response.content)
+
+
+@pytest.fixture(scope="class")
+def audit_available(auth_headers):
+    """Whether /api/audit-logs is mounted (probed once per test class)."""
+    from .helpers import client
+    response = client.get("/api/audit-logs", headers=auth_headers)
+    return response.status_code != 404
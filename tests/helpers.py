@@ -0,0 +1,192 @@
+"""
+Shared test helpers: the in-process API client and locally signed tokens.
+
+Importing this module installs the mock Supabase/settings overrides on the
+app, so every test module (and conftest.py fixture) shares one client.
+"""
+
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+from fastapi.testclient import TestClient
+from jose import jwt
+
+from src.main import app
+from src.config import get_settings
+from src.middleware.auth import get_supabase_client, get_supabase_anon_client
+
+# =============================================================================
+# MOCK INFRASTRUCTURE
+# =============================================================================
+
+class MockSupabaseResponse:
+    def __init__(self, data):
+        self.data = data
+
+class MockTable:
+    def __init__(self, name):
+        self.name = name
+        self.last_op = None
+        self.last_data = None
+    
+    def insert(self, data):
+        self.last_op = "insert"
+        self.last_data = data
+        return self
+    
+    def update(self, data):
+        self.last_op = "update"
+        self.last_data = data
+        return self
+        
+    def upsert(self, data):
+        self.last_op = "upsert"
+        self.last_data = data
+        return self
+    
+    def select(self, *args, **kwargs):
+        self.last_op = "select"
+        return self
+    
+    def eq(self, *args, **kwargs):
+        return self
+    
+    def order(self, *args, **kwargs):
+        return self
+        
+    def limit(self, *args, **kwargs):
+        return self
+
+    def single(self):
+        return self
+
+    def execute(self):
+        # Handle write operations
+        if self.last_op in ("insert", "update", "upsert"):
+            if isinstance(self.last_data, dict):
+                # Return list with ID for write operations
+                resp_data = self.last_data.copy()
+                if "id" not in resp_data:
+                    resp_data["id"] = "00000000-0000-0000-0000-000000000001"
+                if self.name == "profiles" and "created_at" not in resp_data:
+                     # Ensure created_at for profiles if checking return value
+                     resp_data["created_at"] = datetime.utcnow().isoformat()
+                return MockSupabaseResponse([resp_data])
+            return MockSupabaseResponse(self.last_data)
+
+        # Handle read operations
+        if self.name == "profiles":
+            return MockSupabaseResponse({
+                "id": "00000000-0000-0000-0000-000000000001",
+                "email": "test@example.com",
+                "role": "free",
+                "created_at": datetime.utcnow().isoformat()
+            })
+        elif self.name == "rate_limits":
+            # Return usage that is comfortably within limits
+            return MockSupabaseResponse({
+                "user_id": "00000000-0000-0000-0000-000000000001",
+                "requests_this_minute": 0,
+                "requests_today": 0,
+                "last_minute_reset": datetime.utcnow().isoformat(),
+                "last_day_reset": datetime.utcnow().date().isoformat()
+            })
+        elif self.name == "audit_logs":
+            return MockSupabaseResponse([])
+        return MockSupabaseResponse([])
+
+class MockAuth:
+    def sign_up(self, credentials):
+        class MockUser:
+            id = "00000000-0000-0000-0000-000000000001"
+            email = credentials.get("email")
+        class MockSession:
+            access_token = "mock-token"
+        
+        class Result:
+            user = MockUser()
+            session = MockSession()
+        return Result()
+
+    def sign_in_with_password(self, credentials):
+        class MockUser:
+            id = "00000000-0000-0000-0000-000000000001"
+            email = credentials.get("email")
+        class MockSession:
+            access_token = "mock-token"
+            
+        class Result:
+            user = MockUser()
+            session = MockSession()
+        return Result()
+
+class MockSupabaseClient:
+    def __init__(self):
+        self.auth = MockAuth()
+
+    def table(self, name):
+        return MockTable(name)
+
+    def rpc(self, name, params):
+        # consume_rate_limit: always within limits
+        return MockRpc([{
+            "allowed": True,
+            "limit_type": None,
+            "retry_after_seconds": None
+        }])
+
+class MockRpc:
+    def __init__(self, data):
+        self.data = data
+
+    def execute(self):
+        return MockSupabaseResponse(self.data)
+
+# Force settings for testing BEFORE creating the client
+from src.config import Settings
+def get_test_settings():
+    return Settings(
+        ai_provider="placeholder",
+        openai_api_key="mock-key",
+        anthropic_api_key="mock-key",
+        jwt_secret="super-secret-jwt-key-for-testing-only-12345"
+    )
+
+def get_mock_supabase():
+    return MockSupabaseClient()
+
+app.dependency_overrides[get_settings] = get_test_settings
+app.dependency_overrides[get_supabase_client] = get_mock_supabase
+app.dependency_overrides[get_supabase_anon_client] = get_mock_supabase
+
+client = TestClient(app)
+
+# Helper to generate valid tokens locally for testing
+# (Matches the backend's expected signature)
+def create_test_token(user_id: str, email: str, role: str = "authenticated") -> str:
+    settings = get_settings()
+    expire = datetime.utcnow() + timedelta(minutes=15)
+    to_encode = {
+        "sub": user_id,
+        "email": email,
+        "role": role,
+        "exp": expire,
+        "aud": "authenticated"
+    }
+    encoded_jwt = jwt.encode(to_encode, settings.jwt_secret, algorithm="HS256")
+    return encoded_jwt
+
+# =============================================================================
+# HELPER FUNCTIONS
+# =============================================================================
+
+@lru_cache(maxsize=8)
+def get_auth_token(email: str = "test@example.com") -> str:
+    """
+    Generate a valid test token without needing Supabase Auth.
+    
+    Memoized per email: the token outlives a test run (15 min expiry);
+    call get_auth_token.cache_clear() to force a fresh one.
+    """
+    # Use a fixed UUID for testing
+    return create_test_token("00000000-0000-0000-0000-000000000001", email)
@@ -0,0 +1,79 @@
+"""
+ANALYSIS MEMO TESTS
+
+The entity/tone memo (src/services/analysis_cache.py) is off by default,
+keys entries by digest rather than raw text, and honours its configured size.
+"""
+
+import pytest
+
+from src.config import get_settings
+from src.services import analysis_cache
+from src.services.analysis_cache import AnalysisMemo
+from src.services.entity_validator import EntityValidator
+from src.services.tone_analyzer import ToneAnalyzer
+
+
+@pytest.fixture
+def configure(monkeypatch):
+    """Swap in settings with the given ANALYSIS_CACHE_SIZE."""
+    def _configure(size: int):
+        settings = get_settings().model_copy(update={"analysis_cache_size": size})
+        monkeypatch.setattr(analysis_cache, "get_settings", lambda: settings)
+    return _configure
+
+
+class Counter:
+    """Stand-in analyzer that counts how often it is really run."""
+    def __init__(self):
+        self.calls = 0
+
+    def run(self, text):
+        self.calls += 1
+        return (text.upper(),)
+
+
+def test_disabled_by_default_computes_every_time(configure):
+    configure(0)
+    memo, counter = AnalysisMemo("test"), Counter()
+
+    for _ in range(3):
+        memo.get_or_compute(Counter, "same text", lambda: counter.run("same text"))
+
+    assert counter.calls == 3
+    assert not memo._entries
+
+
+def test_keys_are_digests_not_text(configure):
+    configure(8)
+    memo, counter = AnalysisMemo("test"), Counter()
+    text = "A confidential draft."
+
+    first = memo.get_or_compute(Counter, text, lambda: counter.run(text))
+    second = memo.get_or_compute(Counter, text, lambda: counter.run(text))
+
+    assert first is second and counter.calls == 1
+    (key,) = memo._entries
+    assert isinstance(key, bytes) and len(key) == 16
+    assert text.encode("utf-8") not in key
+
+
+def test_configured_size_bounds_the_memo(configure):
+    configure(2)
+    memo, counter = AnalysisMemo("test"), Counter()
+
+    for text in ("a", "b", "a", "c"):  # "a" refreshed, so "b" is evicted
+        memo.get_or_compute(Counter, text, lambda t=text: counter.run(t))
+    memo.get_or_compute(Counter, "a", lambda: counter.run("a"))
+    assert counter.calls == 3
+    memo.get_or_compute(Counter, "b", lambda: counter.run("b"))
+    assert counter.calls == 4
+    assert len(memo._entries) == 2
+
+
+def test_validators_share_results_when_enabled(configure):
+    configure(4)
+    text = "In 2020, 50% of Acme users reported faster load times."
+
+    assert EntityValidator().extract_entities(text) is EntityValidator().extract_entities(text)
+    assert ToneAnalyzer().analyze(text) is ToneAnalyzer().analyze(text)
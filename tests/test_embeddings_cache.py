@@ -0,0 +1,123 @@
+"""
+EMBEDDINGS CACHE TESTS
+
+Covers the opt-in original-text embedding cache (src/services/embeddings.py):
+- In-memory LRU eviction (EMBEDDINGS_CACHE_SIZE)
+- SQLite round-trip (EMBEDDINGS_CACHE_PATH)
+- float16 vector encoding
+- Disabled cache is a pure pass-through
+"""
+
+import asyncio
+
+import pytest
+
+from src.config import get_settings
+from src.services import embeddings
+from src.services.embeddings import PlaceholderEmbeddingsProvider
+
+
+@pytest.fixture
+def configure(monkeypatch):
+    """Swap in settings with the given cache options (empty caches each test)."""
+    def _configure(size: int = 0, path: str = ""):
+        settings = get_settings().model_copy(
+            update={"embeddings_cache_size": size, "embeddings_cache_path": path}
+        )
+        monkeypatch.setattr(embeddings, "get_settings", lambda: settings)
+    embeddings._embedding_cache.clear()
+    yield _configure
+    embeddings._embedding_cache.clear()
+    with embeddings._disk_cache_lock:
+        for conn in embeddings._disk_cache_conns.values():
+            conn.close()
+        embeddings._disk_cache_conns.clear()
+
+
+@pytest.fixture
+def provider():
+    return PlaceholderEmbeddingsProvider(dimensions=16)
+
+
+def test_disabled_cache_is_pass_through(configure, provider, monkeypatch):
+    """With both options off, nothing is hashed, stored or found."""
+    configure()
+    monkeypatch.setattr(
+        provider, "_cache_key",
+        lambda text: pytest.fail("cache key computed while caching is disabled")
+    )
+    vector = [0.1, 0.2, 0.3]
+
+    assert asyncio.run(provider._cache_store("original", vector)) is vector
+    assert asyncio.run(provider._cache_lookup("original")) is None
+    assert not embeddings._embedding_cache
+
+
+def test_memory_lru_evicts_least_recently_used(configure, provider):
+    configure(size=2)
+
+    async def scenario():
+        await provider._cache_store("a", [1.0])
+        await provider._cache_store("b", [2.0])
+        assert await provider._cache_lookup("a") == [1.0]  # "a" now most recent
+        await provider._cache_store("c", [3.0])
+        return [await provider._cache_lookup(t) for t in ("a", "b", "c")]
+
+    assert asyncio.run(scenario()) == [[1.0], None, [3.0]]
+    assert len(embeddings._embedding_cache) == 2
+
+
+def test_disk_cache_round_trip(configure, provider, tmp_path):
+    """Entries survive losing the in-memory layer (i.e. a restart)."""
+    configure(size=0, path=str(tmp_path / "embeddings.db"))
+
+    async def scenario():
+        miss = await provider.compute_similarity("the original", "a proposal")
+        assert not embeddings._embedding_cache
+        assert await provider._cache_lookup("the original") is not None
+        hit = await provider.compute_similarity("the original", "a proposal")
+        return miss, hit
+
+    miss, hit = asyncio.run(scenario())
+    # The stored value is returned on a miss too, so scores agree exactly
+    assert hit == miss
+
+
+def test_disk_cache_is_keyed_by_model(configure, tmp_path):
+    configure(path=str(tmp_path / "embeddings.db"))
+    small = PlaceholderEmbeddingsProvider(dimensions=16)
+    large = PlaceholderEmbeddingsProvider(dimensions=32)
+
+    asyncio.run(small._cache_store("text", [0.5] * 16))
+
+    assert asyncio.run(large._cache_lookup("text")) is None
+    assert asyncio.run(small._cache_lookup("text")) == [0.5] * 16
+
+
+def test_float16_round_trip():
+    vector = [0.0, 1.0, -0.5, 0.123456, -0.987654, 1e-3]
+    blob = embeddings.EmbeddingsProvider._encode_vector(vector)
+
+    assert len(blob) == 2 * len(vector)
+    decoded = embeddings.EmbeddingsProvider._decode_vector(blob)
+    assert len(decoded) == len(vector)
+    for original, restored in zip(vector, decoded):
+        assert restored == pytest.approx(original, abs=1e-3)
+    # Decoding is stable: re-encoding a decoded vector is lossless
+    assert embeddings.EmbeddingsProvider._encode_vector(decoded) == blob
+
+
+def test_unusable_disk_cache_never_fails_a_request(configure, provider, tmp_path):
+    """SQLite errors degrade to a cache miss (read) or a skipped write."""
+    configure(size=2, path=str(tmp_path / "missing-dir" / "embeddings.db"))
+
+    async def scenario():
+        miss = await provider.compute_similarity("the original", "a proposal")
+        hit = await provider.compute_similarity("the original", "a proposal")
+        return miss, hit
+
+    miss, hit = asyncio.run(scenario())
+    assert hit == miss
+    assert not embeddings._disk_cache_conns
+    # The in-memory layer still works without the file
+    assert len(embeddings._embedding_cache) == 1
@@ -0,0 +1,58 @@
+"""
+ENTITY VALIDATOR BATCH TESTS
+
+EntityValidator.validate_batch must agree with validate pair by pair,
+extract each distinct text once, and reject misaligned inputs.
+"""
+
+import pytest
+
+from src.services.entity_validator import EntityValidator
+
+
+ORIGINAL = "In 2020, 50% of Acme users reported faster load times (Smith, 2021)."
+PROPOSALS = [
+    "In 2020, 50% of Acme users saw faster load times (Smith, 2021).",
+    "In 2021, 60% of Acme users reported faster load times (Smith, 2021).",
+    "Acme users reported faster load times.",
+]
+
+
+@pytest.fixture
+def validator():
+    return EntityValidator()
+
+
+def test_batch_size_mismatch_raises(validator):
+    with pytest.raises(ValueError, match="Batch size mismatch: 2 originals vs 1 proposals"):
+        validator.validate_batch([ORIGINAL, ORIGINAL], PROPOSALS[:1])
+
+
+def test_shared_original_extracted_once(validator, monkeypatch):
+    """An original shared by every pair costs one extraction, not one per pair."""
+    calls = []
+    extract = validator.extract_entities
+
+    def counting_extract(text):
+        calls.append(text)
+        return extract(text)
+
+    monkeypatch.setattr(validator, "extract_entities", counting_extract)
+
+    results = validator.validate_batch([ORIGINAL] * len(PROPOSALS), PROPOSALS)
+
+    assert calls.count(ORIGINAL) == 1
+    assert sorted(calls) == sorted([ORIGINAL, *PROPOSALS])
+    assert [r.risk_level for r in results] == ["none", "high", "high"]
+
+
+def test_batch_matches_validate(validator):
+    results = validator.validate_batch([ORIGINAL] * len(PROPOSALS), PROPOSALS)
+
+    assert [r.to_dict() for r in results] == [
+        validator.validate(ORIGINAL, proposed).to_dict() for proposed in PROPOSALS
+    ]
+
+
+def test_empty_batch(validator):
+    assert validator.validate_batch([], []) == []
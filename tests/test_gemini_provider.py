@@ -0,0 +1,91 @@
+"""
+GEMINI STREAMING TESTS
+
+Drives GeminiProvider.generate_proposal with a faked async stream (no SDK
+or network needed): chunks are reassembled into the JSON proposal, and a
+non-JSON prefix is rejected without consuming the rest of the stream.
+"""
+
+import asyncio
+
+import pytest
+
+from src.services.ai_provider import AIProposalError, SanityChecker
+from src.services.gemini_provider import GeminiProvider
+
+
+ORIGINAL = "The board has decided to restructure the division next quarter."
+
+
+class _Chunk:
+    """Stand-in for a streamed GenerateContentResponse chunk."""
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeStreamingModel:
+    """Fake GenerativeModel whose stream yields the given text pieces."""
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.consumed = 0
+
+    async def _stream(self):
+        for piece in self.pieces:
+            self.consumed += 1
+            yield _Chunk(piece)
+
+    async def generate_content_async(self, message, generation_config=None, stream=False):
+        assert stream is True
+        return self._stream()
+
+
+def make_provider(pieces):
+    """A GeminiProvider wired to a fake model (bypasses SDK setup in __init__)."""
+    provider = GeminiProvider.__new__(GeminiProvider)
+    provider.model_name = "fake-gemini"
+    provider.sanity_checker = SanityChecker()
+    provider.model = FakeStreamingModel(pieces)
+    provider.generation_config = None
+    return provider
+
+
+def test_streamed_chunks_are_joined():
+    provider = make_provider([
+        "",
+        "  \n",
+        '{"proposed_text": "The board decided to ',
+        'restructure the division next quarter.", ',
+        '"explanation_summary": "Tightened wording."}',
+    ])
+
+    proposal = asyncio.run(provider.generate_proposal(ORIGINAL, "rewrite"))
+
+    assert proposal.proposed_text == "The board decided to restructure the division next quarter."
+    assert proposal.explanation_summary == "Tightened wording."
+    assert provider.model.consumed == 5
+
+
+def test_non_json_prefix_rejected_early():
+    provider = make_provider([
+        " ",
+        "Sure! Here is your rewrite:",
+        '{"proposed_text": "unused", "explanation_summary": "unused"}',
+        "never reached",
+    ])
+
+    with pytest.raises(AIProposalError) as exc_info:
+        asyncio.run(provider.generate_proposal(ORIGINAL, "rewrite"))
+
+    assert "Non-JSON stream prefix" in exc_info.value.internal_reason
+    # Rejected on the first non-blank chunk; the rest was never pulled
+    assert provider.model.consumed == 2
+
+
+def test_truncated_json_rejected():
+    provider = make_provider(['{"proposed_text": "The board'])
+
+    with pytest.raises(AIProposalError) as exc_info:
+        asyncio.run(provider.generate_proposal(ORIGINAL, "rewrite"))
+
+    assert "JSON parse failed" in exc_info.value.internal_reason
@@ -2,17 +2,19 @@
 STRICT SEMANTIC VALIDATION TESTS
 
 Verifies the Semantic Meaning Validator (SMV) behaves as a STRICT SENSOR.
-Thresholds:
-- SAFE: >= 0.80
-- RISKY: 0.60 <= x < 0.80
+Thresholds (defaults, see src/config.py):
+- SAFE: >= 0.85
+- RISKY: 0.60 <= x < 0.85
 - DANGEROUS: < 0.60
 
 These tests use a Mock Embeddings Provider to ensure DETERMINISTIC scores.
 We define input pairs and FORCE specific similarity scores to verify the classification logic.
 """
 
+import asyncio
+import functools
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
 
 from src.services.semantic import SemanticValidator, SemanticValidationError
 from src.services.embeddings import EmbeddingsProvider
@@ -20,139 +22,197 @@ from src.models.schemas import SemanticResult
 from src.config import get_settings
 
 
+# Shared dummy vector for get_embedding (the interface returns a list;
+# every caller gets this same object, so it must not be mutated)
+_DUMMY_EMBED = [0.1, 0.2, 0.3]
+
+
 class MockEmbeddingsProvider(EmbeddingsProvider):
     """
     Mock provider that returns pre-determined scores.
     This guarantees DETERMINISTIC testing of the threshold logic.
     """
+
     def __init__(self):
+        # original -> {proposed -> score} (no tuple key built per lookup)
         self.score_map = {}
 
     def set_score(self, original: str, proposed: str, score: float):
-        self.score_map[(original, proposed)] = score
+        self.score_map.setdefault(original, {})[proposed] = score
 
     async def compute_similarity(self, text1: str, text2: str) -> float:
-        return self.score_map.get((text1, text2), 0.0)
+        scores = self.score_map.get(text1)
+        return scores.get(text2, 0.0) if scores else 0.0
         
     async def get_embedding(self, text: str) -> list[float]:
-        return [0.1, 0.2, 0.3]  # Dummy
+        return _DUMMY_EMBED
 
 
-@pytest.fixture
-def validator():
-    provider = MockEmbeddingsProvider()
-    return SemanticValidator(provider), provider
+# One event loop for the whole module: the mock provider does no I/O, so
+# a fresh loop per test (pytest-asyncio) would be pure setup overhead
+_LOOP = asyncio.new_event_loop()
 
 
-@pytest.mark.asyncio
-async def test_pure_paraphrase_safe(validator):
-    """
-    Test 1: Pure paraphrase (High similarity) -> SAFE
-    Expectation: Score >= 0.80
+def run_sync(fn):
+    """Run an async test to completion on the module's shared loop."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        return _LOOP.run_until_complete(fn(*args, **kwargs))
+    return wrapper
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _close_loop():
+    yield
+    _LOOP.run_until_complete(_LOOP.shutdown_default_executor())
+    _LOOP.close()
+
+
+@pytest.fixture(scope="module")
+def provider():
+    """One mock provider shared by the module (scores reset per test)."""
+    return MockEmbeddingsProvider()
+
+
+@pytest.fixture(scope="module")
+def smv(provider):
+    return SemanticValidator(provider)
+
+
+@pytest.fixture(autouse=True)
+def _reset_scores(provider):
     """
-    smv, provider = validator
+    Give every test an empty score map on the shared provider.
     
-    original = "The system is functioning normally."
-    proposed = "The system is operating as expected."
-    
-    # Force a score of 0.85 (SAFE)
-    provider.set_score(original, proposed, 0.85)
+    (Keys can't be namespaced per test instead: they are the texts under
+    validation, which the entity/tone checks read.)
+    """
+    provider.score_map.clear()
+
+
+# Labelled scenarios: (name, original, proposed, forced score, expected label)
+CASES = [
+    # Pure paraphrase (high similarity) -> SAFE
+    ("pure_paraphrase",
+     "The system is functioning normally.",
+     "The system is operating as expected.",
+     0.85, "safe"),
+    # Tone strengthening (moderate similarity) -> RISKY
+    ("tone_strengthening",
+     "This approach might work.",
+     "This approach will almost certainly work.",
+     0.70, "risky"),
+    # Meaning reversal (low similarity) -> DANGEROUS
+    ("meaning_reversal",
+     "We should proceed with the launch.",
+     "We should abort the launch.",
+     0.20, "dangerous"),
+]
+
+
+def pytest_generate_tests(metafunc):
+    if "case" in metafunc.fixturenames:
+        metafunc.parametrize("case", CASES, ids=[c[0] for c in CASES])
+
+
+@run_sync
+async def test_labelled_case(smv, provider, case):
+    """
+    Each scenario keeps its forced score and gets the expected label.
+    """
+    _, original, proposed, score, label = case
+    provider.set_score(original, proposed, score)
     
     result = await smv.validate(original, proposed)
     
-    assert result.similarity_score == 0.85
-    assert result.risk_label == "safe"
+    assert result.similarity_score == score
+    assert result.risk_label == label
+
 
+# Exact boundaries of the configured thresholds (>= is inclusive)
+_SETTINGS = get_settings()
+BOUNDARY_CASES = [
+    (_SETTINGS.threshold_safe, "safe"),
+    (round(_SETTINGS.threshold_safe - 0.01, 2), "risky"),
+    (_SETTINGS.threshold_risky, "risky"),
+    (round(_SETTINGS.threshold_risky - 0.01, 2), "dangerous"),
+]
 
-@pytest.mark.asyncio
-async def test_tone_strengthening_risky(validator):
+
+@run_sync
+@pytest.mark.parametrize("score,label", BOUNDARY_CASES)
+async def test_boundary_conditions(smv, provider, score, label):
     """
-    Test 2: Tone strengthening (Moderate similarity) -> RISKY
-    Expectation: 0.60 <= Score < 0.80
+    Test exact boundary conditions to verify strict inequalities.
     """
-    smv, provider = validator
-    
-    original = "This approach might work."
-    proposed = "This approach will almost certainly work."
-    
-    # Force a score of 0.70 (RISKY)
-    # Note: With old thresholds (0.75), this would be RISKY.
-    # With new thresholds (0.80), this is STILL RISKY.
-    provider.set_score(original, proposed, 0.70)
-    
-    result = await smv.validate(original, proposed)
-    
-    assert result.similarity_score == 0.70
-    assert result.risk_label == "risky"
+    provider.set_score("Boundary original", "Boundary proposed", score)
+    res = await smv.validate("Boundary original", "Boundary proposed")
+    assert res.risk_label == label
 
 
-@pytest.mark.asyncio
-async def test_meaning_reversal_dangerous(validator):
+@run_sync
+@pytest.mark.parametrize("proposed,score,label", [
+    ("Text plus unrelated concepts", 0.55, "dangerous"),  # Scope expansion
+    ("TEXT!", 0.78, "risky"),  # Certainty inflation
+], ids=["scope_expansion", "certainty_inflation"])
+async def test_failure_modes_prevented(smv, provider, proposed, score, label):
     """
-    Test 3: Meaning reversal (Low similarity) -> DANGEROUS
-    Expectation: Score < 0.60
+    Verify strict "Sensor" behavior against specific failure modes via scores.
     """
-    smv, provider = validator
-    
-    original = "We should proceed with the launch."
-    proposed = "We should abort the launch."
-    
-    # Force a score of 0.20 (DANGEROUS)
-    provider.set_score(original, proposed, 0.20)
-    
-    result = await smv.validate(original, proposed)
-    
-    assert result.similarity_score == 0.20
-    assert result.risk_label == "dangerous"
+    original = "Text"
+    provider.set_score(original, proposed, score)
+    res = await smv.validate(original, proposed)
+    assert res.risk_label == label
 
 
-@pytest.mark.asyncio
-async def test_boundary_conditions(validator):
+@run_sync
+async def test_validate_batch_matches_validate(smv, provider):
     """
-    Test exact boundary conditions to verify strict inequalities.
+    validate_batch returns the same results as validate, in input order.
     """
-    smv, provider = validator
-    
-    # EDGE CASE 1: Exactly 0.80 -> SAFE
-    t1_orig, t1_prop = "A", "A_Safe"
-    provider.set_score(t1_orig, t1_prop, 0.80)
-    res1 = await smv.validate(t1_orig, t1_prop)
-    assert res1.risk_label == "safe"
-    
-    # EDGE CASE 2: Exactly 0.79 -> RISKY
-    t2_orig, t2_prop = "B", "B_Risky"
-    provider.set_score(t2_orig, t2_prop, 0.79)
-    res2 = await smv.validate(t2_orig, t2_prop)
-    assert res2.risk_label == "risky"
+    pairs = [(original, proposed) for _, original, proposed, _, _ in CASES]
+    for _, original, proposed, score, _ in CASES:
+        provider.set_score(original, proposed, score)
     
-    # EDGE CASE 3: Exactly 0.60 -> RISKY
-    t3_orig, t3_prop = "C", "C_Risky"
-    provider.set_score(t3_orig, t3_prop, 0.60)
-    res3 = await smv.validate(t3_orig, t3_prop)
-    assert res3.risk_label == "risky"
+    results = await smv.validate_batch(pairs)
     
-    # EDGE CASE 4: Exactly 0.59 -> DANGEROUS
-    t4_orig, t4_prop = "D", "D_Dangerous"
-    provider.set_score(t4_orig, t4_prop, 0.59)
-    res4 = await smv.validate(t4_orig, t4_prop)
-    assert res4.risk_label == "dangerous"
+    assert [r.risk_label for r in results] == [c[4] for c in CASES]
+    for (original, proposed), result in zip(pairs, results):
+        assert result == await smv.validate(original, proposed)
 
 
-@pytest.mark.asyncio
-async def test_failure_modes_prevented(validator):
+@run_sync
+async def test_polarity_flip_is_dangerous_and_skips_claims_and_tone(smv, provider):
     """
-    Verify strict "Sensor" behavior against specific failure modes via scores.
+    A negation flip is DANGEROUS even at high similarity (white paper 4.5),
+    and claim/tone analysis is not run for it.
     """
-    smv, provider = validator
+    original = "This approach is clearly not effective."
+    proposed = "This approach is clearly effective."
+    provider.set_score(original, proposed, 0.93)
     
-    original = "Text"
+    res = await smv.validate(original, proposed)
     
-    # Scope Expansion -> Low Similarity -> Dangerous
-    provider.set_score(original, "Text plus unrelated concepts", 0.55)
-    res = await smv.validate(original, "Text plus unrelated concepts")
+    assert res.polarity_flip is True
     assert res.risk_label == "dangerous"
-    
-    # Certainty Inflation -> Moderate Similarity -> Risky
-    provider.set_score(original, "TEXT!", 0.78)
-    res = await smv.validate(original, "TEXT!")
-    assert res.risk_label == "risky"
+    assert res.claim_analysis is None
+    assert res.tone_analysis is None
+    assert res.similarity_score == 0.93
+
+
+@pytest.mark.parametrize("original,proposed,flipped", [
+    ("Do not.", "Do it.", True),
+    ("It works (never) as claimed.", "It works as claimed.", True),
+    ("No-one objected.", "Everyone objected.", True),
+    ("It isn't ready.", "It is ready.", True),
+    ("We can't ship.", "We won't ship.", False),
+    ("A notable result.", "A known result.", False),  # "no" inside a word
+    ("This is clearly not effective.", "This is clearly not effective!", False),
+], ids=["not_period", "never_parens", "no_hyphen", "nt_contraction",
+        "both_negated", "substring_only", "unchanged_negation"])
+def test_detect_polarity_flip(smv, original, proposed, flipped):
+    """
+    Negations count next to punctuation, and "n't" counts in any contraction.
+    """
+    assert smv._detect_polarity_flip(original, proposed) is flipped
+    assert smv._detect_polarity_flip(proposed, original) is flipped